@@ -17,15 +17,29 @@ from collections.abc import (
     Sequence,
     Set,
 )
-from dataclasses import MISSING, Field, asdict, dataclass, fields, is_dataclass, replace
+from dataclasses import MISSING, Field, dataclass, fields, is_dataclass, replace
 from datetime import date, datetime, time, timedelta
-from functools import reduce
+from functools import cached_property, lru_cache, reduce, wraps
 from importlib import import_module
-from inspect import cleandoc, get_annotations, getmodule, getsource, isabstract
+from inspect import cleandoc, get_annotations, getsource, isabstract
 from pathlib import Path
 from textwrap import dedent
 from types import MappingProxyType, ModuleType, NoneType, UnionType
-from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Generic, TypeVar, Union, cast, get_args, get_origin, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    ClassVar,
+    Concatenate,
+    Generic,
+    ParamSpec,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    overload,
+)
 from weakref import WeakKeyDictionary
 
 if sys.version_info < (3, 11):
@@ -34,9 +48,46 @@ else:
     import tomllib  # pragma: no cover
 
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _id_cache(func: Callable[Concatenate[Any, _P], _R]) -> Callable[Concatenate[Any, _P], _R]:
+    """
+    Cache the results of a function by the identity of its first argument, which is a type annotation.
+
+    Identity is used instead of equality, since equal unions can list their members in a different order.
+    Each cache entry holds a reference to the annotation, so its identity cannot be reused by another object.
+    The other arguments are not part of the key: they must only be used in error messages.
+    Nothing is cached when the function raises an exception.
+    """
+    cache: dict[int, tuple[object, _R]] = {}
+
+    @wraps(func)
+    def wrapper(annotation: Any, /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        try:
+            return cache[id(annotation)][1]
+        except KeyError:
+            result = func(annotation, *args, **kwargs)
+            cache[id(annotation)] = (annotation, result)
+            return result
+
+    return wrapper
+
+
+@_id_cache
+def _get_origin_args(annotation: object) -> tuple[Any, tuple[Any, ...]]:
+    """
+    Return the origin and type arguments of the given type annotation.
+
+    The results are cached, since the same streamlined annotations are inspected for every value that we bind.
+    """
+    return get_origin(annotation), get_args(annotation)
+
+
 # Note: Actually 'field_type' can either be a type of a typing special form,
 #       but there is no way yet to annotate typing special forms.
-#       This is the source of a lot of the casts and suppressions in this function.
+#       This is the source of a lot of the casts and suppressions in this function and _collect_generic_type().
 def _collect_type(field_type: type, context: str) -> type | Binder[Any]:
     """
     Verify and streamline a type annotation.
@@ -46,7 +97,7 @@ def _collect_type(field_type: type, context: str) -> type | Binder[Any]:
 
     Raises TypeError if the annotation is not supported.
     """
-    origin = get_origin(field_type)
+    origin, args = _get_origin_args(field_type)
     if origin is None:
         if field_type is Any:  # type: ignore[comparison-overlap]
             return object
@@ -61,31 +112,51 @@ def _collect_type(field_type: type, context: str) -> type | Binder[Any]:
         else:
             # Any type that we don't explicitly support is treated as a nested data class.
             return Binder(field_type)
-    elif origin in (UnionType, Union):
+
+    return _collect_generic_type(field_type, context)
+
+
+@_id_cache
+def _collect_generic_type(field_type: Any, context: str) -> type | Binder[Any]:
+    """
+    Verify and streamline a generic type annotation.
+
+    The results are cached, since the same annotations tend to be used in many dataclasses.
+
+    Raises TypeError if the annotation is not supported.
+    """
+    origin, args = _get_origin_args(field_type)
+    if origin in (UnionType, Union):
+        # Note that 'arg' cannot be a union itself, as Python automatically flattens nested union types.
+        if len(args) == 2:
+            # Fast path for the most common unions: 'T | None' and 'A | B'.
+            first, second = args
+            if second is NoneType:
+                return _collect_type(first, context)
+            elif first is NoneType:
+                return _collect_type(second, context)
+            else:
+                collected_first = _collect_type(first, context)
+                collected_second = _collect_type(second, context)
+                return operator.__or__(collected_first, collected_second)  # type: ignore[no-any-return]
         collected_types = [
-            # Note that 'arg' cannot be a union itself, as Python automatically flattens nested union types.
             _collect_type(arg, context)
-            for arg in get_args(field_type)
+            for arg in args
             # Optional fields are allowed, but None can only be the default, not the parsed value.
             if arg is not NoneType
         ]
-        # Note that the list of collected types cannot be empty as Python either rejects (None | None) or
-        # simplifies (Union[None] to NoneType) union annotations that contain nothing but None.
-        if len(collected_types) == 1:
-            return collected_types[0]
-        else:
-            return reduce(operator.__or__, collected_types)
+        # Unions of two members were handled above and Python removes duplicate members,
+        # so at least two members remain after leaving out None.
+        return reduce(operator.__or__, collected_types)
     elif issubclass(origin, Mapping):
-        type_args = get_args(field_type)
         try:
-            key_type, value_type = type_args
+            key_type, value_type = args
         except ValueError:
             raise TypeError(f"Mapping '{context}' must have two type arguments") from None
         if key_type is not str:
             raise TypeError(f"Mapping '{context}' has key type '{key_type.__name__}', expected 'str'")
         return origin[(key_type, _collect_type(value_type, f"{context}[]"))]  # type: ignore[no-any-return]
     elif issubclass(origin, Iterable):
-        args = get_args(field_type)
         arg_context = f"{context}[]"
         if issubclass(origin, tuple):
             if len(args) == 2 and args[-1] is ...:
@@ -97,10 +168,11 @@ def _collect_type(field_type: type, context: str) -> type | Binder[Any]:
         return origin[_collect_type(args[0], arg_context)]  # type: ignore[no-any-return]
     elif origin is type:
         try:
-            (arg,) = get_args(field_type)
+            (arg,) = args
         except ValueError:
             raise TypeError(f"type[...] annotation for '{context}' must have exactly one type argument") from None
-        bases = get_args(arg) if get_origin(arg) in (UnionType, Union) else (arg,)
+        arg_origin, arg_args = _get_origin_args(arg)
+        bases = arg_args if arg_origin in (UnionType, Union) else (arg,)
         if Any in bases:
             return cast(type, type[Any])
         # Convert 'type[A | B]' to 'type[A] | type[B]'.
@@ -120,6 +192,25 @@ def _find_object_by_name(name: str, context: str) -> object:
 
     Raises ValueError if the name could not be resolved.
     """
+    try:
+        return _resolve_object(name)
+    except _ObjectNotFoundError as ex:
+        raise ValueError(f"Python object for '{context}' not found: {ex.args[0]}") from None
+
+
+class _ObjectNotFoundError(Exception):
+    """Raised by _resolve_object() if the name could not be resolved."""
+
+
+@lru_cache(maxsize=4096)
+def _resolve_object(name: str) -> object:
+    """
+    Look up a Python object by its fully-qualified name.
+
+    Successful lookups are cached, since importing a module again would return the same object.
+    Raises _ObjectNotFoundError if the name could not be resolved.
+    Exceptions raised while importing a module are propagated unchanged.
+    """
     parts = name.split(".")
 
     # Figure out how many parts form the module name.
@@ -134,39 +225,40 @@ def _find_object_by_name(name: str, context: str) -> object:
         idx += 1
 
     if node is None:
-        raise ValueError(f"Python object for '{context}' not found: no top-level module named '{parts[0]}'")
+        raise _ObjectNotFoundError(f"no top-level module named '{parts[0]}'")
 
     while idx < len(parts):
         try:
             node = getattr(node, parts[idx])
         except AttributeError:
-            raise ValueError(
-                f"Python object for '{context}' not found: "
-                f"name '{parts[idx]}' does not exist in '{'.'.join(parts[:idx])}'"
-            ) from None
+            raise _ObjectNotFoundError(f"name '{parts[idx]}' does not exist in '{'.'.join(parts[:idx])}'") from None
         idx += 1
 
     return node
 
 
-def _find_field(full_name: str, field_names: Collection[str]) -> tuple[str, str | None]:
+def _find_field(full_name: str, field_names: Collection[str]) -> tuple[str, str]:
     """
-    Return the field name and optional suffix for the given full name.
+    Return the field name and suffix for the given full name.
 
+    This is only used to explain why a key was rejected, so the full name never matches a field exactly.
     Raises KeyError if no such field exists.
     """
-    if full_name in field_names:
-        return full_name, None
-    try:
-        name, suffix = full_name.rsplit("_", 1)
-    except ValueError:
-        raise KeyError(full_name) from None
-    if name in field_names:
+    name, sep, suffix = full_name.rpartition("_")
+    if sep and name in field_names:
         return name, suffix
     else:
         raise KeyError(full_name)
 
 
+_EVALUATED_ANNOTATIONS_CACHE: MutableMapping[type[Any], dict[str, object]] = WeakKeyDictionary()
+"""
+The evaluated string annotations of each class that declares fields.
+
+Subclasses of a dataclass share these, so the annotations of a base class are only evaluated once.
+"""
+
+
 def _get_fields(cls: type) -> Iterator[tuple[Field, type]]:
     """
     Iterates through all the fields in a dataclass.
@@ -177,19 +269,31 @@ def _get_fields(cls: type) -> Iterator[tuple[Field, type]]:
     fields_by_name = {field.name: field for field in fields(cls)}
 
     for field_container in reversed(cls.__mro__):
-        # Note: getmodule() can return None, but the end result is still fine.
-        cls_globals = getattr(getmodule(field_container), "__dict__", {})
-        cls_locals = vars(field_container)
+        annotations = get_annotations(field_container)
+        if not annotations:
+            continue
 
-        for name, annotation in get_annotations(field_container).items():
+        try:
+            evaluated = _EVALUATED_ANNOTATIONS_CACHE[field_container]
+        except KeyError:
+            evaluated = _EVALUATED_ANNOTATIONS_CACHE[field_container] = {}
+
+        for name, annotation in annotations.items():
             field = fields_by_name[name]
             if not field.init:
                 continue
             if isinstance(annotation, str):
                 try:
-                    annotation = eval(annotation, cls_globals, cls_locals)  # noqa: PGH001
-                except NameError as ex:
-                    raise TypeError(f"Failed to parse annotation of field '{cls.__name__}.{name}': {ex}") from None
+                    annotation = evaluated[name]
+                except KeyError:
+                    # Note: The module can be missing from sys.modules, but the end result is still fine.
+                    cls_globals = getattr(sys.modules.get(field_container.__module__), "__dict__", {})
+                    cls_locals = vars(field_container)
+                    try:
+                        annotation = eval(annotation, cls_globals, cls_locals)  # noqa: PGH001
+                    except NameError as ex:
+                        raise TypeError(f"Failed to parse annotation of field '{cls.__name__}.{name}': {ex}") from None
+                    evaluated[name] = annotation
             yield field, annotation
 
 
@@ -200,23 +304,318 @@ def _check_field(field: Field, field_type: type, context: str) -> None:
     This does not do a full type check: there are better tools for that.
     Instead, it checks specific limitations that our Binder imposes on dataclasses.
     """
-    if get_origin(field_type) is UnionType and NoneType in get_args(field_type) and field.default is not None:
+    origin, args = _get_origin_args(field_type)
+    if origin is UnionType and NoneType in args and field.default is not None:
         raise TypeError(f"Default for optional field '{context}' is not None")
 
 
-_TIMEDELTA_SUFFIXES = {"days", "seconds", "microseconds", "milliseconds", "minutes", "hours", "weeks"}
+_BindFunc = Callable[[object, str], object]
+"""
+Converts a TOML value to a specific field type.
+
+The first argument is the TOML value, the second the context to use in error messages.
+Raises TypeError if the TOML value's type doesn't match the field type.
+"""
+
+
+def _add_element_context(ex: Exception, context: str, elem_context: str) -> None:
+    """
+    Put the context of a container element in the message of an exception raised while binding that element.
+
+    Elements are bound using the context of their container, so binding a large array or table doesn't format
+    a context string for every element. When an element fails to bind, this inserts its index or key into
+    the message instead, which happens once at every nesting level as the exception propagates.
+    Messages that don't mention the container context are left unchanged.
+    """
+    match ex.args:
+        case (str(message),):
+            ex.args = (message.replace(f"'{context}", f"'{elem_context}", 1),)
+
+
+def _make_bind_func(field_type: type | Binder[Any]) -> _BindFunc:
+    """
+    Return a function that converts TOML values to the given streamlined field type.
+
+    All decisions that only depend on the field type are made here, once per field,
+    instead of every time a value is bound.
+    """
+    if isinstance(field_type, Binder):
+        binder = field_type
+
+        def bind_nested(value: object, context: str) -> object:
+            return binder._bind_to_table(value, None, context)
+
+        return bind_nested
+
+    origin, type_args = _get_origin_args(field_type)
+    if origin is None:
+        return _make_single_bind_func(field_type)
+    elif origin is UnionType:
+        member_binders = tuple(_make_bind_func(arg) for arg in type_args)
+        # Usually only one member of a union can accept a value of a given type.
+        # By looking up the candidate members, we avoid raising and catching TypeError for the other members.
+        # Types that are not in this mapping, such as subclasses of the TOML value types, try all members.
+        candidates_by_value_type = {
+            value_type: tuple(
+                bind_member
+                for arg, bind_member in zip(type_args, member_binders, strict=True)
+                if _accepts_value_type(arg, value_type)
+            )
+            for value_type in _BOUND_VALUE_TYPES
+        }
+
+        def bind_union(value: object, context: str) -> object:
+            for bind_member in candidates_by_value_type.get(type(value), member_binders):
+                try:
+                    return bind_member(value, context)
+                except TypeError:
+                    # TODO: When the union contains multiple custom classes, we pick the first that succeeds.
+                    #       It would be cleaner to limit custom classes to one at collection time.
+                    pass
+            raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected '{field_type}'")
+
+        return bind_union
+    elif issubclass(origin, Mapping):
+        key_type, elem_type = type_args
+        bind_elem = _make_bind_func(elem_type)
+        # The factory converts the bound dictionary to the field type; None means the dictionary is used as-is.
+        mapping_factory: Callable[[dict[str, Any]], object] | None = (
+            (None if issubclass(origin, MutableMapping) else MappingProxyType)
+            if isabstract(origin)
+            else (None if origin is dict else field_type)
+        )
+
+        def bind_mapping(value: object, context: str) -> object:
+            if not isinstance(value, dict):
+                raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected table")
+            mapping = {}
+            try:
+                for key, elem in value.items():
+                    mapping[key] = bind_elem(elem, context)
+            except (TypeError, ValueError) as ex:
+                _add_element_context(ex, context, f'{context}["{key}"]')
+                raise
+            return mapping if mapping_factory is None else mapping_factory(mapping)
+
+        return bind_mapping
+    elif issubclass(origin, tuple):
+        # Note that _collect_type() replaced homogeneous tuple annotations by Sequence[T].
+        elem_binders = tuple(_make_bind_func(arg) for arg in type_args)
+
+        def bind_tuple(value: object, context: str) -> object:
+            if not isinstance(value, list):
+                raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected array")
+            if len(elem_binders) != len(value):
+                raise TypeError(f"Expected {len(elem_binders)} elements for '{context}', got {len(value)}")
+            # Building a list first is faster than passing a generator to tuple().
+            elems = []
+            try:
+                for elem, bind_elem in zip(value, elem_binders, strict=True):
+                    elems.append(bind_elem(elem, context))
+            except (TypeError, ValueError) as ex:
+                _add_element_context(ex, context, f"{context}[{len(elems)}]")
+                raise
+            return tuple(elems)
+
+        return bind_tuple
+    elif issubclass(origin, Iterable):
+        (elem_type,) = type_args
+        bind_elem = _make_bind_func(elem_type)
+        # The factory converts the bound list to the field type; None means the list is used as-is.
+        sequence_factory: Callable[[list[Any]], object] | None = (
+            (None if issubclass(origin, MutableSequence) else tuple)
+            if isabstract(origin)
+            else (None if origin is list else field_type)
+        )
+
+        def bind_sequence(value: object, context: str) -> object:
+            if not isinstance(value, list):
+                raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected array")
+            # Building a list first is faster than passing a generator to the sequence factory.
+            elems: list[Any] = []
+            append = elems.append
+            try:
+                for elem in value:
+                    append(bind_elem(elem, context))
+            except (TypeError, ValueError) as ex:
+                _add_element_context(ex, context, f"{context}[{len(elems)}]")
+                raise
+            return elems if sequence_factory is None else sequence_factory(elems)
+
+        return bind_sequence
+    elif origin is type:
+        # Note that _collect_type() already verified the type args.
+        (expected_type,) = type_args
+
+        def bind_class(value: object, context: str) -> object:
+            if not isinstance(value, str):
+                raise TypeError(f"Expected TOML string for Python reference '{context}', got '{type(value).__name__}'")
+            obj = _find_object_by_name(value, context)
+            if not isinstance(obj, type):
+                raise TypeError(f"Value for '{context}' has type '{type(obj).__name__}', expected class")
+            if expected_type is Any or issubclass(obj, expected_type):
+                return obj
+            else:
+                raise TypeError(
+                    f"Resolved '{context}' to class '{obj.__name__}', expected subclass of '{expected_type.__name__}'"
+                )
+
+        return bind_class
+    else:
+        # This is currently unreachable because we reject unsupported generic types in _collect_type().
+        raise AssertionError(origin)
+
+
+_BOUND_VALUE_TYPES = (str, int, float, bool, datetime, date, time, timedelta, dict, list)
+"""The types of the values produced by the TOML parser, plus 'timedelta' for Python values that are bound directly."""
+
+
+def _accepts_value_type(field_type: type, value_type: type) -> bool:
+    """
+    Return True iff the given streamlined non-union field type can bind a value of the given type.
+
+    This mirrors the type checks done by the bind functions, which remain the final authority:
+    a value of an accepted type can still be rejected, for example when a container element doesn't match.
+    """
+    origin, _ = _get_origin_args(field_type)
+    if origin is None:
+        if field_type is ModuleType or issubclass(field_type, Path):
+            return value_type is str
+        elif field_type is timedelta:
+            return issubclass(value_type, timedelta | time)
+        elif value_type is bool:
+            return field_type is bool or field_type is object
+        else:
+            return issubclass(value_type, field_type)
+    elif issubclass(origin, Mapping):
+        return value_type is dict
+    elif issubclass(origin, Iterable):
+        return value_type is list
+    else:
+        # Class references.
+        return value_type is str
+
+
+def _make_single_bind_func(field_type: type) -> _BindFunc:
+    """
+    Return a function that converts TOML values to the given non-generic field type.
+
+    The returned function raises TypeError if the TOML value's type doesn't match the field type.
+    """
+    if field_type is ModuleType:
+
+        def bind_module(value: object, context: str) -> object:
+            if not isinstance(value, str):
+                raise TypeError(f"Expected TOML string for Python reference '{context}', got '{type(value).__name__}'")
+            module = _find_object_by_name(value, context)
+            if not isinstance(module, ModuleType):
+                raise TypeError(f"Value for '{context}' has type '{type(module).__name__}', expected module")
+            return module
+
+        return bind_module
+    elif field_type is timedelta:
+
+        def bind_timedelta(value: object, context: str) -> object:
+            if isinstance(value, timedelta):
+                return value
+            elif isinstance(value, time):
+                return timedelta(
+                    hours=value.hour, minutes=value.minute, seconds=value.second, microseconds=value.microsecond
+                )
+            else:
+                raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected time")
+
+        return bind_timedelta
+    elif issubclass(field_type, Path):
+
+        def bind_path(value: object, context: str) -> object:
+            if not isinstance(value, str):
+                raise TypeError(f"Expected TOML string for path '{context}', got '{type(value).__name__}'")
+            return field_type(value)
+
+        return bind_path
+    elif field_type is object:
+
+        def bind_any(value: object, context: str) -> object:  # noqa: ARG001
+            return value
+
+        return bind_any
+    else:
+        # TOML booleans are only accepted by 'bool' fields, even though 'bool' is a subclass of 'int'.
+        reject_bool = field_type is not bool
+
+        def bind_instance(value: object, context: str) -> object:
+            if isinstance(value, field_type) and not (reject_bool and type(value) is bool):
+                return value
+            raise TypeError(
+                f"Value for '{context}' has type '{type(value).__name__}', expected '{field_type.__name__}'"
+            )
+
+        return bind_instance
+
+
+_TIMEDELTA_CONSTRUCTORS: Mapping[str, Callable[[float], timedelta]] = {
+    "days": lambda value: timedelta(days=value),
+    "seconds": lambda value: timedelta(seconds=value),
+    "microseconds": lambda value: timedelta(microseconds=value),
+    "milliseconds": lambda value: timedelta(milliseconds=value),
+    "minutes": lambda value: timedelta(minutes=value),
+    "hours": lambda value: timedelta(hours=value),
+    "weeks": lambda value: timedelta(weeks=value),
+}
+"""Functions that convert a number to a timedelta, by the key suffix that specifies the unit."""
+
+
+def _make_suffix_bind_func(suffix: str) -> _BindFunc:
+    """Return a function that converts a TOML number to a timedelta, using the given key suffix as the unit."""
+    construct = _TIMEDELTA_CONSTRUCTORS[suffix]
+
+    def bind_suffix(value: object, context: str) -> object:
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            return construct(value)
+        else:
+            raise TypeError(
+                f"Value for '{context}' with suffix '{suffix}' has type '{type(value).__name__}', expected number"
+            )
+
+    return bind_suffix
+
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class _TomlField:
+    """The information to format a dataclass field as TOML that does not depend on the value being formatted."""
+
+    name: str
+    key: str
+    key_fmt: str
+    docstring: str | None
+    default: Any
+    field_type: type | Binder[Any]
+
+    @property
+    def optional(self) -> bool:
+        return self.default is not MISSING
+
+    @cached_property
+    def default_fmt(self) -> str | None:
+        default = self.default
+        return None if default is MISSING or default is None else format_toml_pair(self.key, default)
+
+
 @dataclass(slots=True)
 class _ClassInfo(Generic[T]):
 
-    _cache: ClassVar[MutableMapping[type[Any], _ClassInfo[Any]]] = WeakKeyDictionary()
+    # Note: A weak-keyed cache would not help here, as each entry holds a strong reference to its dataclass.
+    _cache: ClassVar[dict[type[Any], _ClassInfo[Any]]] = {}
 
     dataclass: type[T]
     field_types: Mapping[str, type | Binder[Any]]
-    _field_docstrings: Mapping[str, str] | None = None
+    field_keys: Mapping[str, tuple[str, _BindFunc]]
+    """Maps every accepted TOML key, including suffixed ones, to a field name and the function that binds its value."""
+    _toml_fields: Sequence[_TomlField] | None = None
 
     @classmethod
     def get(cls, dataclass: type[T]) -> _ClassInfo[T]:
@@ -226,12 +625,19 @@ class _ClassInfo(Generic[T]):
             # Populate field_types *after* adding new instance to the cache to make sure
             # _collect_type() will find the given dataclass if it's accessed recursively.
             field_types: dict[str, type | Binder[Any]] = {}
-            info = cls(dataclass, field_types)
+            field_keys: dict[str, tuple[str, _BindFunc]] = {}
+            info = cls(dataclass, field_types, field_keys)
             cls._cache[dataclass] = info
             for field, field_type in _get_fields(dataclass):
                 field_name = field.name
                 context = f"{dataclass.__name__}.{field_name}"
-                field_types[field_name] = _collect_type(field_type, context)
+                field_types[field_name] = collected_type = _collect_type(field_type, context)
+                # A field name takes precedence over the same name formed by adding a suffix to another field.
+                key = field_name.replace("_", "-")
+                field_keys[key] = (field_name, _make_bind_func(collected_type))
+                if collected_type is timedelta:
+                    for suffix in _TIMEDELTA_CONSTRUCTORS:
+                        field_keys.setdefault(f"{key}-{suffix}", (field_name, _make_suffix_bind_func(suffix)))
                 _check_field(field, field_type, context)
             return info
 
@@ -249,10 +655,44 @@ class _ClassInfo(Generic[T]):
 
     @property
     def field_docstrings(self) -> Mapping[str, str]:
-        field_docstrings = self._field_docstrings
-        if field_docstrings is None:
-            self._field_docstrings = field_docstrings = get_field_docstrings(self.dataclass)
-        return field_docstrings
+        return get_field_docstrings(self.dataclass)
+
+    @property
+    def toml_fields(self) -> Sequence[_TomlField]:
+        """
+        Formatting information for each field that is passed to the constructor.
+
+        This is computed on first use, since binding does not need it and field docstrings are costly to look up.
+        """
+        toml_fields = self._toml_fields
+        if toml_fields is None:
+            field_types = self.field_types
+            docstrings = self.field_docstrings
+            toml_fields = self._toml_fields = tuple(
+                _TomlField(
+                    field.name,
+                    key,
+                    # Most Python names are valid as bare keys, but not if they contain non-ASCII characters.
+                    _format_key(key),
+                    docstrings.get(field.name),
+                    _get_field_default(field),
+                    field_types[field.name],
+                )
+                for field, key in _get_toml_fields(self.dataclass)
+            )
+        return toml_fields
+
+
+def _get_field_default(field: Field[Any]) -> Any:
+    default = field.default
+    if default is MISSING:
+        default_factory = field.default_factory
+        if default_factory is not MISSING:
+            # We don't call the factory:
+            # - to avoid listing a dynamic value as a default, like the current date
+            # - to not trigger any unwanted side effects
+            default = {list: [], dict: {}}.get(default_factory)  # type: ignore[call-overload]
+    return default
 
 
 class Binder(Generic[T]):
@@ -286,150 +726,47 @@ class Binder(Generic[T]):
             self._instance = class_or_instance
         self._class_info = _ClassInfo.get(dataclass)
 
-    def _bind_to_single_type(self, value: object, field_type: type, context: str) -> object:
+    def _bind_to_table(self, value: object, instance: T | None, context: str) -> T:
         """
-        Convert a TOML value to a singular (non-union) field type.
+        Convert a TOML table to an instance of our dataclass.
 
-        Raises TypeError if the TOML value's type doesn't match the field type.
+        Raises TypeError if the TOML value is not a table.
         """
-        origin = get_origin(field_type)
-        if origin is None:
-            if field_type is ModuleType:
-                if not isinstance(value, str):
-                    raise TypeError(
-                        f"Expected TOML string for Python reference '{context}', got '{type(value).__name__}'"
-                    )
-                module = _find_object_by_name(value, context)
-                if not isinstance(module, ModuleType):
-                    raise TypeError(f"Value for '{context}' has type '{type(module).__name__}', expected module")
-                return module
-            elif field_type is timedelta:
-                if isinstance(value, timedelta):
-                    return value
-                elif isinstance(value, time):
-                    return timedelta(
-                        hours=value.hour, minutes=value.minute, seconds=value.second, microseconds=value.microsecond
-                    )
-                else:
-                    raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected time")
-            elif issubclass(field_type, Path):
-                if not isinstance(value, str):
-                    raise TypeError(f"Expected TOML string for path '{context}', got '{type(value).__name__}'")
-                return field_type(value)
-            elif isinstance(value, field_type) and (
-                type(value) is not bool or field_type is bool or field_type is object
-            ):
-                return value
-        elif issubclass(origin, Mapping):
-            if not isinstance(value, dict):
-                raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected table")
-            key_type, elem_type = get_args(field_type)
-            mapping = {
-                key: self._bind_to_field(elem, elem_type, None, f'{context}["{key}"]') for key, elem in value.items()
-            }
-            return (
-                (mapping if isinstance(origin, MutableMapping) else MappingProxyType(mapping))
-                if isabstract(origin)
-                else field_type(mapping)
-            )
-        elif issubclass(origin, Iterable):
-            if not isinstance(value, list):
-                raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected array")
-            type_args = get_args(field_type)
-            if issubclass(origin, tuple):
-                if len(type_args) == len(value):
-                    return tuple(
-                        self._bind_to_field(elem, elem_type, None, f"{context}[{index}]")
-                        for index, (elem, elem_type) in enumerate(zip(value, type_args, strict=True))
-                    )
-                else:
-                    raise TypeError(f"Expected {len(type_args)} elements for '{context}', got {len(value)}")
-            (elem_type,) = type_args
-            container_class = (
-                (list if isinstance(origin, MutableSequence) else tuple) if isabstract(origin) else field_type
-            )
-            return container_class(
-                self._bind_to_field(elem, elem_type, None, f"{context}[{index}]") for index, elem in enumerate(value)
-            )
-        elif origin is type:
-            if not isinstance(value, str):
-                raise TypeError(f"Expected TOML string for Python reference '{context}', got '{type(value).__name__}'")
-            obj = _find_object_by_name(value, context)
-            if not isinstance(obj, type):
-                raise TypeError(f"Value for '{context}' has type '{type(obj).__name__}', expected class")
-            # Note that _collect_type() already verified the type args.
-            (expected_type,) = get_args(field_type)
-            if expected_type is Any or issubclass(obj, expected_type):
-                return obj
-            else:
-                raise TypeError(
-                    f"Resolved '{context}' to class '{obj.__name__}', expected subclass of '{expected_type.__name__}'"
-                )
-        else:
-            # This is currently unreachable because we reject unsupported generic types in _collect_type().
-            raise AssertionError(origin)
-
-        raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected '{field_type.__name__}'")
-
-    def _bind_to_field(self, value: object, field_type: type | Binder[Any], instance: T | None, context: str) -> object:
-        """
-        Convert a TOML value to a field type which is possibly a union type.
-
-        Raises TypeError if the TOML value's type doesn't match the field type.
-        """
-        target_types = get_args(field_type) if get_origin(field_type) is UnionType else (field_type,)
-        for target_type in target_types:
-            try:
-                if isinstance(field_type, Binder):
-                    if not isinstance(value, dict):
-                        raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected table")
-                    return field_type._bind_to_class(value, instance, context)
-                else:
-                    return self._bind_to_single_type(value, target_type, context)
-            except TypeError:
-                if len(target_types) == 1:
-                    raise
-                # TODO: This is inefficient: we format and then discard the error string.
-                #       Union types are not used a lot though, so it's fine for now.
-                # TODO: When the union contains multiple custom classes, we pick the first that succeeds.
-                #       It would be cleaner to limit custom classes to one at collection time.
-        raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected '{field_type}'")
+        if not isinstance(value, dict):
+            raise TypeError(f"Value for '{context}' has type '{type(value).__name__}', expected table")
+        return self._bind_to_class(value, instance, context)
 
     def _bind_to_class(self, toml_dict: Mapping[str, Any], instance: T | None, context: str) -> T:
-        field_types = self._class_info.field_types
+        class_info = self._class_info
+        field_types = class_info.field_types
+        field_keys = class_info.field_keys
         parsed = {}
         for key, value in toml_dict.items():
-            if "_" in key:
-                raise ValueError(f"Underscore found in TOML key '{key}'")
-            field_name = key.replace("-", "_")
             try:
-                field_name, suffix = _find_field(field_name, field_types)
+                field_name, bind_func = field_keys[key]
             except KeyError:
-                raise ValueError(f"Field '{context}.{field_name}' does not exist") from None
-
-            field_type = field_types[field_name]
-            if suffix is not None:
-                if field_type is timedelta and suffix in _TIMEDELTA_SUFFIXES:
-                    if isinstance(value, int | float) and not isinstance(value, bool):
-                        value = timedelta(**{suffix: value})
-                    else:
-                        raise TypeError(
-                            f"Value for '{context}.{field_name}' with suffix '{suffix}' "
-                            f"has type '{type(value).__name__}', expected number"
-                        )
-                else:
-                    type_name = (field_type._dataclass if isinstance(field_type, Binder) else field_type).__name__
-                    raise ValueError(
-                        f"Field '{context}.{field_name}' has type '{type_name}', "
-                        f"which does not support suffix '{suffix}'"
-                    )
-
-            parsed[field_name] = self._bind_to_field(
-                value,
-                field_type,
-                None if instance is None else getattr(instance, field_name),
-                f"{context}.{field_name}",
-            )
+                # The key is invalid; find out why, to produce a helpful error message.
+                if "_" in key:
+                    raise ValueError(f"Underscore found in TOML key '{key}'") from None
+                field_name = key.replace("-", "_")
+                try:
+                    field_name, suffix = _find_field(field_name, field_types)
+                except KeyError:
+                    raise ValueError(f"Field '{context}.{field_name}' does not exist") from None
+                field_type = field_types[field_name]
+                type_name = (field_type._dataclass if isinstance(field_type, Binder) else field_type).__name__
+                raise ValueError(
+                    f"Field '{context}.{field_name}' has type '{type_name}', which does not support suffix '{suffix}'"
+                ) from None
+
+            field_context = f"{context}.{field_name}"
+            if instance is not None:
+                field_type = field_types[field_name]
+                if isinstance(field_type, Binder):
+                    # Nested tables are merged into the corresponding nested object.
+                    parsed[field_name] = field_type._bind_to_table(value, getattr(instance, field_name), field_context)
+                    continue
+            parsed[field_name] = bind_func(value, field_context)
 
         if instance is None:
             return self._dataclass(**parsed)
@@ -473,44 +810,28 @@ class Binder(Generic[T]):
     def _format_toml_table(
         self, instance: T | None, defer: Callable[[Table[Any]], None], *, template: bool
     ) -> Iterator[str]:
-        dataclass = self._dataclass
-        field_types = self._class_info.field_types
-        docstrings = self._class_info.field_docstrings
-
-        for field in fields(dataclass):  # type: ignore[arg-type]
-            if not field.init:
-                continue
-
-            key = field.name.replace("_", "-")
-            # Most Python names are valid as bare keys, but not if they contain non-ASCII characters.
-            key_fmt = "".join(_iter_format_key(key))
-            value = None if instance is None else getattr(instance, field.name)
-            docstring = docstrings.get(field.name)
-
-            default = field.default
-            if default is MISSING:
-                default_factory = field.default_factory
-                if default_factory is not MISSING:
-                    # We don't call the factory:
-                    # - to avoid listing a dynamic value as a default, like the current date
-                    # - to not trigger any unwanted side effects
-                    default = {list: [], dict: {}}.get(default_factory)  # type: ignore[call-overload]
-            optional = default is not MISSING
-
-            field_type = field_types[field.name]
+        for toml_field in self._class_info.toml_fields:
+            key = toml_field.key
+            key_fmt = toml_field.key_fmt
+            value = None if instance is None else getattr(instance, toml_field.name)
+            docstring = toml_field.docstring
+            default = toml_field.default
+            optional = toml_field.optional
+
+            field_type = toml_field.field_type
             if isinstance(field_type, Binder):
                 defer(Table(field_type, key_fmt, value, docstring, optional))
                 continue
-            origin = get_origin(field_type)
+            origin, type_args = _get_origin_args(field_type)
             if origin is not None:
                 if issubclass(origin, Mapping):
-                    key_type, value_type = get_args(field_type)
+                    key_type, value_type = type_args
                     if isinstance(value_type, Binder):
                         if value is None:
                             nested_map = {f"{key_fmt}.<name>": None}
                         else:
                             nested_map = {
-                                f"{key_fmt}.{''.join(_iter_format_key(nested_key))}": nested_value
+                                f"{key_fmt}.{_format_key(nested_key)}": nested_value
                                 for nested_key, nested_value in value.items()
                             }
                         for nested_key_fmt, nested_value in nested_map.items():
@@ -521,7 +842,7 @@ class Binder(Generic[T]):
                             defer(Table(None, key_fmt, value, docstring, optional))
                         continue
                 elif issubclass(origin, Sequence):
-                    (value_type,) = get_args(field_type)
+                    (value_type,) = type_args
                     binder = value_type if isinstance(value_type, Binder) else None
                     if binder is not None or (
                         value_type is object  # Any
@@ -532,7 +853,7 @@ class Binder(Generic[T]):
                             defer(Table(binder, nested_key_fmt, nested_value, docstring, optional))
                         continue
 
-            default_fmt = None if default is MISSING or default is None else format_toml_pair(key, default)
+            default_fmt = toml_field.default_fmt
 
             if value is not None:
                 value_fmt: str | None = format_toml_pair(key, value)
@@ -588,7 +909,7 @@ class Binder(Generic[T]):
             return self.bind(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Table(Generic[T]):
     """The information to format a TOML table."""
 
@@ -604,7 +925,9 @@ class Table(Generic[T]):
         return None if binder is None else binder._class_info.class_docstring
 
     def prefix_context(self, context: str) -> Table[T]:
-        return replace(self, key_fmt=f"{context}.{self.key_fmt}" if context else self.key_fmt)
+        if not context:
+            return self
+        return Table(self.binder, f"{context}.{self.key_fmt}", self.value, self.field_docstring, self.optional)
 
     def format_table(self, inside: Set[type], *, template: bool) -> Iterator[str]:
         """
@@ -629,7 +952,7 @@ class Table(Generic[T]):
                 case Mapping() as mapping:
                     content = [format_toml_pair(k, v) for k, v in mapping.items()]
                 case dc if is_dataclass(dc):
-                    content = [format_toml_pair(k, v) for k, v in asdict(dc).items()]  # type: ignore[arg-type]
+                    content = [format_toml_pair(k, v) for k, v in _dataclass_items(dc)]
                 case _:
                     content = []
         elif value is None and binder._dataclass in inside:
@@ -659,48 +982,55 @@ class Table(Generic[T]):
         yield f"[{self.key_fmt}]"
 
 
+def _dataclass_items(dc: Any) -> Iterator[tuple[str, object]]:
+    """
+    Yield the name and value of every field of a dataclass instance, like `asdict(dc).items()`.
+
+    Nested dataclasses are converted to dictionaries the same way, but unlike `asdict()`,
+    other values are not deep-copied, since we only format them.
+    """
+    for field in fields(dc):
+        yield field.name, _asdict_value(getattr(dc, field.name))
+
+
+def _asdict_value(value: object) -> object:
+    if is_dataclass(value) and not isinstance(value, type):
+        return dict(_dataclass_items(value))
+    elif isinstance(value, list | tuple):
+        return [_asdict_value(elem) for elem in value]
+    elif isinstance(value, dict):
+        return {key: _asdict_value(elem) for key, elem in value.items()}
+    else:
+        return value
+
+
 def format_toml_pair(key: str, value: object) -> str:
     """Format a key/value pair as TOML text."""
+    # Scalars don't need conversion, so format them directly.
+    format_scalar = _TOML_SCALAR_FORMATTERS.get(type(value))
+    if format_scalar is not None:
+        return f"{_format_key(key)} = {format_scalar(value)}"
     suffix, data = _to_toml_pair(value)
     if suffix is not None:
         key += suffix
-    return "".join(_iter_format_key_value(key, data))
+    out: list[str] = []
+    _format_key_value(key, data, out)
+    return "".join(out)
 
 
 def _to_toml_pair(value: object) -> tuple[str | None, Any]:
     """Return a TOML-compatible suffix and value pair with the data from the given rich value object."""
+    # Look up the most common types directly, instead of trying each case of the match statement in turn.
+    convert = _TOML_PAIR_CONVERTERS.get(type(value))
+    if convert is not None:
+        return convert(value)
     match value:
         case str() | int() | float() | date() | time() | Path():  # note: 'bool' is a subclass of 'int'
             return None, value
         case timedelta():
-            if value.days == 0:
-                # Format as local time.
-                sec = value.seconds
-                loc = time(hour=sec // 3600, minute=(sec // 60) % 60, second=sec % 60, microsecond=value.microseconds)
-                return None, loc
-            elif value.microseconds != 0:
-                sec = value.days * 24 * 3600 + value.seconds
-                usec = sec * 1000000 + value.microseconds
-                if usec % 1000 == 0:
-                    return "-milliseconds", usec // 1000
-                else:
-                    return "-microseconds", usec
-            elif value.seconds != 0:
-                sec = value.days * 24 * 3600 + value.seconds
-                if sec % 3600 == 0:
-                    return "-hours", sec // 3600
-                elif sec % 60 == 0:
-                    return "-minutes", sec // 60
-                else:
-                    return "-seconds", sec
-            else:
-                days = value.days
-                if days % 7 == 0:
-                    return "-weeks", days // 7
-                else:
-                    return "-days", days
+            return _timedelta_to_toml_pair(value)
         case ModuleType():
-            return None, value.__name__
+            return _module_to_toml_pair(value)
         case Mapping():
             table = {}
             for key, item_val in value.items():
@@ -721,15 +1051,11 @@ def _to_toml_pair(value: object) -> tuple[str | None, Any]:
             return None, f"{value.__module__}.{value.__name__}"
         case _ if is_dataclass(value):
             table = {}
-            for field in fields(value):
-                if not field.init:
-                    continue
-                name = field.name
-                sub_value = getattr(value, name)
+            for field, key in _get_toml_fields(type(value)):
+                sub_value = getattr(value, field.name)
                 if sub_value is None:
                     assert field.default is None
                     continue
-                key = name.replace("_", "-")
                 suffix, data = _to_toml_pair(sub_value)
                 if suffix is not None:
                     key += suffix
@@ -738,86 +1064,207 @@ def _to_toml_pair(value: object) -> tuple[str | None, Any]:
     raise TypeError(type(value).__name__)
 
 
+_TOML_FIELDS_CACHE: MutableMapping[type[Any], Sequence[tuple[Field, str]]] = WeakKeyDictionary()
+
+
+def _get_toml_fields(dataclass: type[Any]) -> Sequence[tuple[Field, str]]:
+    """Return the fields of a dataclass that are passed to its constructor, each with its TOML key."""
+    try:
+        return _TOML_FIELDS_CACHE[dataclass]
+    except KeyError:
+        toml_fields = _TOML_FIELDS_CACHE[dataclass] = tuple(
+            (field, field.name.replace("_", "-")) for field in fields(dataclass) if field.init
+        )
+        return toml_fields
+
+
+def _native_to_toml_pair(value: object) -> tuple[str | None, Any]:
+    return None, value
+
+
+def _timedelta_to_toml_pair(value: timedelta) -> tuple[str | None, Any]:
+    if value.days == 0:
+        # Format as local time.
+        sec = value.seconds
+        loc = time(hour=sec // 3600, minute=(sec // 60) % 60, second=sec % 60, microsecond=value.microseconds)
+        return None, loc
+    elif value.microseconds != 0:
+        sec = value.days * 24 * 3600 + value.seconds
+        usec = sec * 1000000 + value.microseconds
+        if usec % 1000 == 0:
+            return "-milliseconds", usec // 1000
+        else:
+            return "-microseconds", usec
+    elif value.seconds != 0:
+        sec = value.days * 24 * 3600 + value.seconds
+        if sec % 3600 == 0:
+            return "-hours", sec // 3600
+        elif sec % 60 == 0:
+            return "-minutes", sec // 60
+        else:
+            return "-seconds", sec
+    else:
+        days = value.days
+        if days % 7 == 0:
+            return "-weeks", days // 7
+        else:
+            return "-days", days
+
+
+def _module_to_toml_pair(value: ModuleType) -> tuple[str | None, Any]:
+    return None, value.__name__
+
+
+_TOML_PAIR_CONVERTERS: Mapping[type, Callable[[Any], tuple[str | None, Any]]] = {
+    str: _native_to_toml_pair,
+    int: _native_to_toml_pair,
+    float: _native_to_toml_pair,
+    bool: _native_to_toml_pair,
+    date: _native_to_toml_pair,
+    datetime: _native_to_toml_pair,
+    time: _native_to_toml_pair,
+    timedelta: _timedelta_to_toml_pair,
+    ModuleType: _module_to_toml_pair,
+    # Path() instantiates the concrete path class for the current platform.
+    type(Path()): _native_to_toml_pair,
+}
+
+
 _TOML_ESCAPES = {"\b": r"\b", "\t": r"\t", "\n": r"\n", "\f": r"\f", "\r": r"\r", '"': r"\"", "\\": r"\\"}
-_TOML_BARE_KEY = re.compile(r"^[A-Za-z0-9_\-]+$")
 
 
-def _iter_format_key_value(key: str, value: object) -> Iterator[str]:
-    yield from _iter_format_key(key)
-    yield " = "
-    yield from _iter_format_value(value)
+class _EscapeTable(dict[int, str]):
+    """
+    Translation table that escapes every character that should not occur as-is in a TOML basic string.
+
+    The escapes of non-ASCII characters are computed on demand and then remembered.
+    """
 
+    def __missing__(self, code_point: int) -> str:
+        escape = self[code_point] = f"\\u{code_point:04X}" if code_point < 0x10000 else f"\\U{code_point:08X}"
+        return escape
 
-def _iter_format_key(key: str) -> Iterator[str]:
-    if _TOML_BARE_KEY.match(key):
-        yield key
+
+_TOML_ESCAPE_TABLE = _EscapeTable(
+    {
+        **{code_point: chr(code_point) for code_point in range(0x20, 0x7F)},
+        **{code_point: f"\\u{code_point:04X}" for code_point in (*range(0x20), 0x7F)},
+        **str.maketrans(_TOML_ESCAPES),
+    }
+)
+_is_bare_key = re.compile(r"[A-Za-z0-9_\-]+").fullmatch
+
+
+def _format_key_value(key: str, value: object, out: list[str]) -> None:
+    out.append(_format_key(key))
+    out.append(" = ")
+    _format_value(value, out)
+
+
+@lru_cache(maxsize=1024)
+def _format_key(key: str) -> str:
+    # The same keys are formatted over and over, for example the field names of every table in an array.
+    if _is_bare_key(key):
+        return key
     else:
-        yield from _iter_format_string(key)
+        return _format_string(key)
 
 
-def _iter_format_string(value: str) -> Iterator[str]:
+def _format_string(value: str) -> str:
     # Ideally we could assume that every tool along the way defaults to UTF-8 and just output that,
     # but I don't think we live in that world yet, so escape non-ASCII characters.
-    if value.isprintable() and value.isascii() and "'" not in value:
+    # Order the checks from cheap to expensive: isascii() takes constant time in CPython
+    # and the substring test uses a fast search, while isprintable() checks every character.
+    if value.isascii() and "'" not in value and value.isprintable():
         # Use a literal string if possible.
-        yield "'"
-        yield value
-        yield "'"
+        return f"'{value}'"
     else:
         # Use basic string otherwise.
-        yield '"'
-        for ch in value:
-            if ch.isascii():
-                try:
-                    yield _TOML_ESCAPES[ch]
-                except KeyError:
-                    if ch.isprintable():
-                        yield ch
-                    else:
-                        yield f"\\u{ord(ch):04X}"
-            elif ord(ch) < 0x10000:
-                yield f"\\u{ord(ch):04X}"
-            else:
-                yield f"\\U{ord(ch):08X}"
-        yield '"'
+        return f'"{value.translate(_TOML_ESCAPE_TABLE)}"'
+
 
+def _format_value(value: object, out: list[str]) -> None:
+    """
+    Append the TOML representation of the given value to `out`.
 
-def _iter_format_value(value: object) -> Iterator[str]:
+    We append fragments to a list instead of yielding them, since that avoids the overhead of
+    resuming a chain of nested generators for every fragment.
+    """
+    format_scalar = _TOML_SCALAR_FORMATTERS.get(type(value))
+    if format_scalar is not None:
+        out.append(format_scalar(value))
+        return
+    # Check the concrete container types before the match statement performs its isinstance() checks.
+    if type(value) is dict:
+        _format_inline_table(value, out)
+        return
+    if type(value) is list or type(value) is tuple:
+        _format_array(value, out)
+        return
+    # Note that 'bool' cannot be subclassed, so all booleans are handled by the formatter lookup above,
+    # before the 'int' case below could mistake them for integers.
     match value:
-        case bool():
-            yield str(value).lower()
         case int() | float():
-            yield str(value)
+            out.append(str(value))
         case str():
-            yield from _iter_format_string(value)
+            out.append(_format_string(value))
         case Path():
-            yield from _iter_format_string(str(value))
+            out.append(_format_path(value))
         case date() | time():
-            yield value.isoformat()
+            out.append(value.isoformat())
         case Mapping():
-            first = True
-            yield "{"
-            for key, elem in value.items():
-                if first:
-                    first = False
-                else:
-                    yield ", "
-                yield from _iter_format_key_value(key, elem)
-            yield "}"
+            _format_inline_table(value, out)
         case Iterable():
-            first = True
-            yield "["
-            for elem in value:
-                if first:
-                    first = False
-                else:
-                    yield ", "
-                yield from _iter_format_value(elem)
-            yield "]"
+            _format_array(value, out)
         case _:
             raise TypeError(type(value).__name__)
 
 
+def _format_inline_table(value: Mapping[str, Any], out: list[str]) -> None:
+    first = True
+    out.append("{")
+    for key, elem in value.items():
+        if first:
+            first = False
+        else:
+            out.append(", ")
+        _format_key_value(key, elem, out)
+    out.append("}")
+
+
+def _format_array(value: Iterable[Any], out: list[str]) -> None:
+    first = True
+    out.append("[")
+    for elem in value:
+        if first:
+            first = False
+        else:
+            out.append(", ")
+        _format_value(elem, out)
+    out.append("]")
+
+
+def _format_bool(value: bool) -> str:  # noqa: FBT001
+    return "true" if value else "false"
+
+
+def _format_path(value: Path) -> str:
+    return _format_string(str(value))
+
+
+_TOML_SCALAR_FORMATTERS: Mapping[type, Callable[[Any], str]] = {
+    bool: _format_bool,
+    int: int.__str__,
+    float: float.__str__,
+    str: _format_string,
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    time: time.isoformat,
+    type(Path()): _format_path,
+}
+"""Formatters for scalar values, by exact type. Other types are handled by _format_value() itself."""
+
+
 def _format_comments(*comments: str | None, leading_newline: bool = False) -> Iterator[str]:
     """
     Yield lines containing a formatted version of the given comments.
@@ -844,14 +1291,27 @@ def _format_comments(*comments: str | None, leading_newline: bool = False) -> It
             separator = contains_empty
 
 
+_FIELD_DOCSTRINGS_CACHE: MutableMapping[type[Any], Mapping[str, str]] = WeakKeyDictionary()
+
+
 def get_field_docstrings(dataclass: type[Any]) -> Mapping[str, str]:
     """
     Return a mapping of field name to the docstring for that field.
 
     Attribute docstrings are not supported by the Python runtime, therefore we must read them from the source code.
     If the source code cannot be found, an empty mapping is returned.
+
+    Reading and parsing the source code is relatively expensive, so the result is cached per dataclass.
     """
 
+    try:
+        return _FIELD_DOCSTRINGS_CACHE[dataclass]
+    except KeyError:
+        docstrings = _FIELD_DOCSTRINGS_CACHE[dataclass] = _parse_field_docstrings(dataclass)
+        return docstrings
+
+
+def _parse_field_docstrings(dataclass: type[Any]) -> Mapping[str, str]:
     try:
         source = getsource(dataclass)
     except (OSError, TypeError):
@@ -884,8 +1344,10 @@ def format_template(class_or_instance: Any) -> Iterator[str]:
     yield from Binder(class_or_instance).format_toml_template()
 
 
+@_id_cache
 def _format_value_for_type(field_type: type[Any]) -> str:
-    origin = get_origin(field_type)
+    """Return an example value in TOML format for the given streamlined field type."""
+    origin, args = _get_origin_args(field_type)
     if origin is None:
         if field_type is str:
             return "'???'"
@@ -909,7 +1371,7 @@ def _format_value_for_type(field_type: type[Any]) -> str:
             # We have handled all the non-generic types supported by _collect_type().
             raise AssertionError(field_type)
     elif origin in (UnionType, Union):
-        return " | ".join(_format_value_for_type(arg) for arg in get_args(field_type))
+        return " | ".join(_format_value_for_type(arg) for arg in args)
     elif issubclass(origin, Mapping):
         return "{}"
     elif issubclass(origin, Iterable):
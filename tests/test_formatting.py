@@ -1,32 +1,36 @@
 from __future__ import annotations
 
+import itertools
+import math
+import sys
 from collections.abc import Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, make_dataclass
 from datetime import date, datetime, time, timedelta
 from io import BytesIO
 from pathlib import Path
-from types import ModuleType, NoneType, UnionType
+from types import MappingProxyType, ModuleType, NoneType, UnionType
 from typing import Any, TypeVar, Union, cast, get_args, get_origin
 
 import pytest
 
 from dataclass_binder import Binder, format_template
-from dataclass_binder._impl import _iter_format_value, format_toml_pair, get_field_docstrings
+from dataclass_binder._impl import _format_value, format_toml_pair, get_field_docstrings
 
 from . import example
 
 T = TypeVar("T")
 
 
+_ANNOTATION_NAMES: dict[object, str] = {NoneType: "None", Any: "Any", ModuleType: "ModuleType"}
+"""Annotations that are not spelled as the name of the type they evaluate to."""
+
+
 def format_annotation(annotation: object) -> str:
     origin = get_origin(annotation)
     if origin is None:
-        if annotation is NoneType:
-            return "None"
-        elif annotation is Any:
-            return "Any"
-        elif annotation is ModuleType:
-            return "ModuleType"
+        name = _ANNOTATION_NAMES.get(annotation)
+        if name is not None:
+            return name
         elif isinstance(annotation, type):
             return annotation.__name__
         else:
@@ -37,20 +41,35 @@ def format_annotation(annotation: object) -> str:
         return f"{origin.__name__}[{', '.join(format_annotation(arg) for arg in get_args(annotation))}]"
 
 
+_SINGLE_VALUE_DATACLASSES: dict[tuple[int, bool, bool], tuple[object, type[Any]]] = {}
+
+
 def single_value_dataclass(value_type: Any, *, optional: bool = False, string: bool = False) -> type[Any]:
+    """
+    Return a dataclass with a single field named "value".
+
+    Dataclasses are reused between tests, since many tests use the same combination of arguments.
+    The cache is keyed by the identity of the value type, as equal unions can differ in member order.
+    Each entry holds a reference to the value type, so its identity cannot be reused by another object.
+    """
+
+    cache_key = (id(value_type), optional, string)
+    try:
+        return _SINGLE_VALUE_DATACLASSES[cache_key][1]
+    except KeyError:
+        pass
+
     annotation = value_type | None if optional else value_type
     if string:
         annotation = format_annotation(annotation)
 
-    @dataclass
-    class DC:
-        if optional:
-            value: object = None
-        else:
-            value: object  # type: ignore[no-redef]
-        __annotations__["value"] = annotation
+    # String annotations are evaluated in the namespace of the module that the dataclass claims to be defined in.
+    value_field: tuple[str, Any] | tuple[str, Any, Any]
+    value_field = ("value", annotation, field(default=None)) if optional else ("value", annotation)
+    dc = make_dataclass("DC", [value_field], namespace={"__module__": __name__})
 
-    return DC
+    _SINGLE_VALUE_DATACLASSES[cache_key] = (value_type, dc)
+    return dc
 
 
 def parse_toml(dc: type[T], toml: str) -> T:
@@ -91,6 +110,8 @@ EXAMPLE_NATIVE_VALUES = (
     3.1415927,
     1.23e30,
     1.23e-30,
+    float("inf"),
+    float("-inf"),
     True,
     False,
     "",
@@ -124,43 +145,47 @@ EXAMPLE_CONVERTED_VALUES = (
 
 
 @pytest.mark.parametrize("value", EXAMPLE_NATIVE_VALUES + EXAMPLE_CONVERTED_VALUES)
+def test_format_value_round_trip_exact(*, value: object) -> None:
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(type(value), optional=optional, string=string)
+        assert round_trip_value(value, dc) == value
+
+
 @pytest.mark.parametrize("optional", (True, False))
 @pytest.mark.parametrize("string", (True, False))
-def test_format_value_round_trip_exact(*, value: object, optional: bool, string: bool) -> None:
-    dc = single_value_dataclass(type(value), optional=optional, string=string)
-    assert round_trip_value(value, dc) == value
+def test_format_value_round_trip_nan(*, optional: bool, string: bool) -> None:
+    """Not-a-number is formatted using the TOML special float value, as it is not equal to itself."""
+    assert format_toml_pair("value", float("nan")) == "value = nan"
+    dc = single_value_dataclass(float, optional=optional, string=string)
+    assert math.isnan(round_trip_value(float("nan"), dc))
 
 
 @pytest.mark.parametrize("value", EXAMPLE_NATIVE_VALUES)
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_value_round_trip_any(*, value: object, optional: bool, string: bool) -> None:
-    dc = single_value_dataclass(Any, optional=optional, string=string)
-    assert round_trip_value(value, dc) == value
+def test_format_value_round_trip_any(*, value: object) -> None:
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(Any, optional=optional, string=string)
+        assert round_trip_value(value, dc) == value
 
 
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_value_path(*, optional: bool, string: bool) -> None:
+def test_format_value_path() -> None:
     value = Path("/var/log/lumberjack/")
-    dc = single_value_dataclass(Path, optional=optional, string=string)
-    assert round_trip_value(value, dc) == value
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(Path, optional=optional, string=string)
+        assert round_trip_value(value, dc) == value
 
 
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_value_class(*, optional: bool, string: bool) -> None:
-    dc = single_value_dataclass(type, optional=optional, string=string)
-    assert round_trip_value(example.Config, dc) is example.Config
+def test_format_value_class() -> None:
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(type, optional=optional, string=string)
+        assert round_trip_value(example.Config, dc) is example.Config
 
 
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_value_list_simple(*, optional: bool, string: bool) -> None:
+def test_format_value_list_simple() -> None:
     """A sequence is formatted as a TOML array."""
     value = [1, 2, 3]
-    dc = single_value_dataclass(list[int], optional=optional, string=string)
-    assert round_trip_value(value, dc) == value
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(list[int], optional=optional, string=string)
+        assert round_trip_value(value, dc) == value
 
 
 @pytest.mark.parametrize("optional", (True, False))
@@ -180,28 +205,28 @@ def test_format_value_list_suffix(*, optional: bool, string: bool) -> None:
         round_trip_value([timedelta(days=2)], dc)
 
 
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_value_dict(*, optional: bool, string: bool) -> None:
+def test_format_value_dict() -> None:
     """
     A mapping is formatted as a TOML inline table.
 
     Bare keys are used where possible, otherwise quoted keys.
     """
-    dc = single_value_dataclass(dict[str, int], optional=optional, string=string)
-    value = {"a": 1, "b": 2, "c": 3}
-    assert format_toml_pair("value", value) == "value = {a = 1, b = 2, c = 3}"
-    assert round_trip_value(value, dc) == value
-    value["a space"] = 4
-    value["a.dot"] = 5
-    value[""] = 6
-    assert format_toml_pair("value", value) == "value = {a = 1, b = 2, c = 3, 'a space' = 4, 'a.dot' = 5, '' = 6}"
-    assert round_trip_value(value, dc) == value
-
-
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_value_dict_suffix(*, optional: bool, string: bool) -> None:
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(dict[str, int], optional=optional, string=string)
+        value = {"a": 1, "b": 2, "c": 3}
+        assert format_toml_pair("value", value) == "value = {a = 1, b = 2, c = 3}"
+        assert round_trip_value(value, dc) == value
+        value["a space"] = 4
+        value["a.dot"] = 5
+        value[""] = 6
+        assert format_toml_pair("value", value) == "value = {a = 1, b = 2, c = 3, 'a space' = 4, 'a.dot' = 5, '' = 6}"
+        assert round_trip_value(value, dc) == value
+        value = {"newline\n": 7}
+        assert format_toml_pair("value", value) == r'value = {"newline\n" = 7}'
+        assert round_trip_value(value, dc) == value
+
+
+def test_format_value_dict_suffix() -> None:
     """
     Values that require a suffix can be used in a mapping.
 
@@ -209,11 +234,12 @@ def test_format_value_dict_suffix(*, optional: bool, string: bool) -> None:
           I don't want to spend time fixing this though if we might throw out the entire suffix mechanism;
           see test_format_value_list_suffix() for details.
     """
-    dc = single_value_dataclass(dict[str, timedelta], optional=optional, string=string)
-    assert round_trip_value({}, dc) == {}
-    assert round_trip_value({"delay": timedelta(hours=2)}, dc) == {"delay": timedelta(hours=2)}
-    # assert round_trip({"delay": timedelta(days=2)}, dc) == {"delay": timedelta(days=2)}  # noqa: ERA001
-    assert format_toml_pair("value", {"delay": timedelta(days=2)}) == "value = {delay-days = 2}"
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(dict[str, timedelta], optional=optional, string=string)
+        assert round_trip_value({}, dc) == {}
+        assert round_trip_value({"delay": timedelta(hours=2)}, dc) == {"delay": timedelta(hours=2)}
+        # assert round_trip({"delay": timedelta(days=2)}, dc) == {"delay": timedelta(days=2)}  # noqa: ERA001
+        assert format_toml_pair("value", {"delay": timedelta(days=2)}) == "value = {delay-days = 2}"
 
 
 def test_format_empty_dataclass() -> None:
@@ -231,19 +257,68 @@ class Inner:
     behind_the_curtain: str = field(init=False, default="wizard")
 
 
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_value_nested_dataclass(*, optional: bool, string: bool) -> None:
-    dc = single_value_dataclass(Inner, optional=optional, string=string)
+def test_format_value_nested_dataclass() -> None:
     value = Inner(key_containing_underscores=True, maybesuffix=timedelta(days=2))
-    assert round_trip_value(value, dc) == value
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(Inner, optional=optional, string=string)
+        assert round_trip_value(value, dc) == value
+
+
+def test_format_value_string_escapes() -> None:
+    """Strings that cannot be formatted as literal strings are escaped in a basic string."""
+    assert format_toml_pair("value", "it's") == 'value = "it\'s"'
+    assert format_toml_pair("value", 'tab\tquote"slash\\') == r'value = "tab\tquote\"slash\\"'
+    assert format_toml_pair("value", "bell\u0007del\u007F") == r'value = "bell\u0007del\u007F"'
+    assert format_toml_pair("value", "José \U0001F44D") == r'value = "Jos\u00E9 \U0001F44D"'
+
+
+def test_format_value_subclasses() -> None:
+    """Values of subclasses of the supported types are formatted like values of the base type."""
+
+    class Name(str):
+        pass
+
+    class Count(int):
+        pass
+
+    class Delay(timedelta):
+        pass
+
+    class Plugin(ModuleType):
+        pass
+
+    assert format_toml_pair("value", Name("Jos")) == "value = 'Jos'"
+    assert format_toml_pair("value", Count(3)) == "value = 3"
+    assert format_toml_pair("value", Delay(days=2)) == "value-days = 2"
+    assert format_toml_pair("value", Plugin("plugins.example")) == "value = 'plugins.example'"
+
+
+def test_format_value_subclasses_native() -> None:
+    """Subclasses of types with a native TOML representation and other container types are formatted as well."""
+
+    class Location(type(Path())):  # type: ignore[misc]
+        pass
+
+    class Day(date):
+        pass
+
+    assert format_toml_pair("value", Location("/tmp")) == "value = '/tmp'"
+    assert format_toml_pair("value", Day(2022, 10, 5)) == "value = 2022-10-05"
+
+    out: list[str] = []
+    _format_value(MappingProxyType({"a": 1}), out)
+    assert "".join(out) == "{a = 1}"
+
+    out = []
+    _format_value(frozenset({1}), out)
+    assert "".join(out) == "[1]"
 
 
 def test_format_value_unsupported_type() -> None:
     with pytest.raises(TypeError, match="^NoneType$"):
         format_toml_pair("unsupported", None)
     with pytest.raises(TypeError, match="^NoneType$"):
-        list(_iter_format_value(None))
+        _format_value(None, [])
 
 
 def test_docstring_extraction_example() -> None:
@@ -252,14 +327,46 @@ def test_docstring_extraction_example() -> None:
         "database_url": "The URL of the database to connect to.",
         "port": "TCP port on which to accept connections.",
     }
+    # The source is only parsed once per class.
+    assert get_field_docstrings(example.Config) is docstrings
 
 
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_docstring_extraction_indented(*, optional: bool, string: bool) -> None:
-    dc = single_value_dataclass(int, optional=optional, string=string)
-    docstrings = get_field_docstrings(dc)
-    assert docstrings == {}
+def test_docstring_extraction_indented() -> None:
+    """Docstrings are extracted from a class that is defined in an indented block."""
+
+    @dataclass
+    class Indented:
+        name: str
+        """Name of the thing."""
+
+        size: int = 0
+        """
+        Size of the thing.
+
+        Zero means unknown.
+        """
+
+    assert get_field_docstrings(Indented) == {
+        "name": "Name of the thing.",
+        "size": "Size of the thing.\n\nZero means unknown.",
+    }
+
+
+def test_docstring_extraction_nested() -> None:
+    """Classes are found by their qualified name, also when they are nested in another class or function."""
+
+    @dataclass
+    class Outer:
+        @dataclass
+        class Nested:
+            value: int
+            """Nested value."""
+
+        value: int
+        """Outer value."""
+
+    assert get_field_docstrings(Outer) == {"value": "Outer value."}
+    assert get_field_docstrings(Outer.Nested) == {"value": "Nested value."}
 
 
 @dataclass(kw_only=True)
@@ -525,6 +632,26 @@ numbers = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
     )
 
 
+def test_format_template_union_order() -> None:
+    """Example values for union fields list the options in annotation order."""
+
+    @dataclass
+    class Config:
+        number_or_name: int | str
+        name_or_number: str | int
+
+    template = "\n".join(Binder(Config).format_toml_template())
+    assert template == (
+        """
+# Mandatory.
+number-or-name = 0 | '???'
+
+# Mandatory.
+name-or-number = '???' | 0
+""".strip()
+    )
+
+
 def test_format_template_sequence_default() -> None:
     """
     When formatting, a sequence value is considered equal to the default if it would produce identical TOML,
@@ -637,21 +764,61 @@ untyped = [1, 2.0, {untyped = ['three', false]}]
     )
 
 
+def test_format_template_sequence_untyped_dataclass_table() -> None:
+    """
+    Dataclasses in untyped tables are formatted like `asdict()`: all fields, keys named after the fields.
+
+    Unlike `asdict()`, values are not deep-copied, so values that cannot be copied can be formatted too.
+    """
+
+    @dataclass
+    class Point:
+        x_pos: int
+
+    @dataclass
+    class Marker:
+        display_name: str
+        location: Point
+        route: tuple[Point, ...]
+        neighbours: dict[str, Point]
+        plugin: ModuleType
+        kind: type
+        derived: int = field(init=False, default=5)
+
+    @dataclass
+    class Config:
+        untyped: list[Any]
+
+    config = Config([Marker("home", Point(1), (Point(2), Point(3)), {"north": Point(4)}, example, Point)])
+    template = "\n".join(Binder(config).format_toml_template())
+    assert template == (
+        """
+[[untyped]]
+display_name = 'home'
+location = {x_pos = 1}
+route = [{x_pos = 2}, {x_pos = 3}]
+neighbours = {north = {x_pos = 4}}
+plugin = 'tests.example'
+kind = 'tests.test_formatting.Point'
+derived = 5
+""".strip()
+    )
+
+
 @pytest.mark.parametrize(
     "field_type", (str, int, float, datetime, date, time, timedelta, list[str], dict[str, int], NestedConfig)
 )
-@pytest.mark.parametrize("optional", (True, False))
-@pytest.mark.parametrize("string", (True, False))
-def test_format_template_valid_value(*, field_type: type[Any], optional: bool, string: bool) -> None:
+def test_format_template_valid_value(*, field_type: type[Any]) -> None:
     """
     The template generated for the given field type is valid TOML and the value has the right type.
 
     Not all templates values are valid TOML, but the selected parameters are.
     """
-    dc = single_value_dataclass(field_type, optional=optional, string=string)
-    toml = "\n".join(Binder(dc).format_toml_template())
-    print(field_type, "->", toml)  # noqa: T201
-    parse_toml(dc, toml)
+    for optional, string in itertools.product((False, True), repeat=2):
+        dc = single_value_dataclass(field_type, optional=optional, string=string)
+        toml = "\n".join(Binder(dc).format_toml_template())
+        print(field_type, "->", toml)  # noqa: T201
+        parse_toml(dc, toml)
 
 
 @dataclass
@@ -859,3 +1026,23 @@ def test_format_template_no_module(sourceless_class: type[Any]) -> None:
 value = 0
 """.strip()
     )
+
+
+@pytest.mark.parametrize("filename", ("<generated>", "/nonexistent/generated.py"))
+def test_docstring_extraction_missing_file(monkeypatch: pytest.MonkeyPatch, filename: str) -> None:
+    """If the source file of a module cannot be read, we can't extract docstrings; fail gracefully."""
+
+    module = ModuleType("generated")
+    module.__file__ = filename
+    module.__dict__["dataclass"] = dataclass
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    exec(
+        """
+@dataclass
+class C:
+    value: int
+    "This docstring cannot be extracted."
+""",
+        module.__dict__,
+    )
+    assert get_field_docstrings(module.C) == {}
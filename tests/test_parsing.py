@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, MutableSequence, Sequence
 from contextlib import contextmanager
 from dataclasses import FrozenInstanceError, dataclass, field
 from datetime import date, datetime, time, timedelta
 from io import BytesIO
 from pathlib import Path
-from types import ModuleType
+from types import MappingProxyType, ModuleType
 from typing import Any, BinaryIO, Generic, TypeVar
 
 import pytest
 
 from dataclass_binder import Binder
-from dataclass_binder._impl import _find_object_by_name
+from dataclass_binder._impl import _find_object_by_name, _resolve_object
 
 from . import example
 
@@ -69,6 +69,30 @@ def test_find_object_by_name_missing() -> None:
         _find_object_by_name("dataclass_binder.no-such-name", "Config.bad_class")
 
 
+def test_find_object_by_name_import_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Exceptions raised while importing a module are not reported as a missing object."""
+
+    (tmp_path / "broken_plugin.py").write_text('import os\nsetting = os.environ["NO_SUCH_VARIABLE"]\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delenv("NO_SUCH_VARIABLE", raising=False)
+
+    with pytest.raises(KeyError, match=r"^'NO_SUCH_VARIABLE'$"):
+        _find_object_by_name("broken_plugin.Plugin", "Config.plugin")
+
+
+def test_find_object_by_name_cached() -> None:
+    """Repeated lookups of the same name are served from the cache, failed lookups report each context."""
+
+    _find_object_by_name("tests.example.TEMPLATE", "Config.first")
+    hits = _resolve_object.cache_info().hits
+    assert _find_object_by_name("tests.example.TEMPLATE", "Config.second") is example.TEMPLATE
+    assert _resolve_object.cache_info().hits == hits + 1
+
+    for context in ("Config.first", "Config.second"):
+        with pytest.raises(ValueError, match=rf"^Python object for '{context}' not found: "):
+            _find_object_by_name("tests.example.NO_SUCH_NAME", context)
+
+
 @dataclass(frozen=True)
 class Config:
     rest_api_port: int
@@ -197,6 +221,50 @@ def test_bind_mutable() -> None:
     assert config.limits == {"ram-gb": 1, "disk-gb": 100, "processes": 4}
 
 
+def test_bind_mutable_abstract() -> None:
+    """When using abstract mutable collection types as annotations, mutable collections are created."""
+
+    @dataclass
+    class MutableConfig:
+        tags: MutableSequence[str]
+        limits: MutableMapping[str, int]
+
+    with stream_text(
+        """
+        tags = ["production", "development"]
+        limits = {ram-gb = 1, disk-gb = 100}
+        """
+    ) as stream:
+        config = Binder(MutableConfig).parse_toml(stream)
+
+    config.tags.append("staging")
+    assert config.tags == ["production", "development", "staging"]
+
+    config.limits["processes"] = 4
+    assert config.limits == {"ram-gb": 1, "disk-gb": 100, "processes": 4}
+
+
+def test_bind_immutable_abstract() -> None:
+    """When using abstract immutable collection types as annotations, immutable collections are created."""
+
+    @dataclass
+    class ImmutableConfig:
+        tags: Sequence[str]
+        limits: Mapping[str, int]
+
+    with stream_text(
+        """
+        tags = ["production", "development"]
+        limits = {ram-gb = 1, disk-gb = 100}
+        """
+    ) as stream:
+        config = Binder(ImmutableConfig).parse_toml(stream)
+
+    assert config.tags == ("production", "development")
+    assert isinstance(config.limits, MappingProxyType)
+    assert config.limits == {"ram-gb": 1, "disk-gb": 100}
+
+
 def test_bind_optional() -> None:
     """Dataclass fields can have a default value of None."""
 
@@ -249,6 +317,66 @@ def test_bind_union() -> None:
         Binder(UnionConfig).parse_toml(stream)
 
 
+def test_bind_union_none_first() -> None:
+    """The position of None in an optional union annotation does not matter."""
+
+    @dataclass(frozen=True)
+    class OptionalFirstConfig:
+        trend_identifier: None | str = None
+        limit: None | int | float = None
+
+    with stream_text("trend-identifier = 'fly'\nlimit = 1.5") as stream:
+        config = Binder(OptionalFirstConfig).parse_toml(stream)
+    assert config.trend_identifier == "fly"
+    assert config.limit == 1.5
+
+
+def test_bind_union_containers() -> None:
+    """Unions can combine container and scalar types."""
+
+    @dataclass(frozen=True)
+    class UnionConfig:
+        limit: list[int] | dict[str, int] | float | Path
+
+    with stream_text("limit = [1, 2]") as stream:
+        assert Binder(UnionConfig).parse_toml(stream).limit == [1, 2]
+    with stream_text("limit = {a = 1}") as stream:
+        assert Binder(UnionConfig).parse_toml(stream).limit == {"a": 1}
+    with stream_text("limit = 0.5") as stream:
+        assert Binder(UnionConfig).parse_toml(stream).limit == 0.5
+    with stream_text("limit = '/dev/null'") as stream:
+        assert Binder(UnionConfig).parse_toml(stream).limit == Path("/dev/null")
+
+    with (
+        stream_text("limit = 1") as stream,
+        pytest.raises(
+            TypeError,
+            match=r"^Value for 'UnionConfig\.limit' has type 'int', "
+            r"expected 'list\[int\] \| dict\[str, int\] \| float \| pathlib\.Path'$",
+        ),
+    ):
+        Binder(UnionConfig).parse_toml(stream)
+
+    with (
+        stream_text("limit = ['one']") as stream,
+        pytest.raises(TypeError, match=r"^Value for 'UnionConfig.limit' has type 'list', expected "),
+    ):
+        Binder(UnionConfig).parse_toml(stream)
+
+
+def test_bind_union_timedelta() -> None:
+    """A union containing timedelta accepts a TOML time for the timedelta member."""
+
+    @dataclass(frozen=True)
+    class UnionConfig:
+        delay: timedelta | str
+
+    with stream_text("delay = 01:02:03") as stream:
+        assert Binder(UnionConfig).parse_toml(stream).delay == timedelta(hours=1, minutes=2, seconds=3)
+    with stream_text("delay = 'never'") as stream:
+        assert Binder(UnionConfig).parse_toml(stream).delay == "never"
+
+
 def test_bind_key_underscore() -> None:
     """ValueError is raised when a TOML key contains an underscore."""
 
@@ -489,6 +617,86 @@ def test_bind_sequence_heterogenous_badelement() -> None:
         Binder(MiniConfig).parse_toml(stream)
 
 
+created_leaves: list[int] = []
+
+
+@dataclass(frozen=True)
+class Leaf:
+    value: int
+
+    def __post_init__(self) -> None:
+        if self.value < 0:
+            raise ValueError("Leaf value must not be negative", self.value)
+        created_leaves.append(self.value)
+
+
+def test_bind_sequence_nested_badelement() -> None:
+    """
+    When an element of a nested sequence is rejected, the elements that were bound before it are not bound again.
+    """
+
+    created_leaves.clear()
+
+    @dataclass(frozen=True)
+    class TreeConfig:
+        leaves: list[list[list[list[Leaf]]]]
+
+    with (
+        stream_text(
+            """
+            leaves = [[[[{value = 1}, {value = "two"}]]]]
+            """
+        ) as stream,
+        pytest.raises(
+            TypeError, match=r"^Value for 'TreeConfig.leaves\[0\]\[0\]\[0\]\[1\].value' has type 'str', expected 'int'$"
+        ),
+    ):
+        Binder(TreeConfig).parse_toml(stream)
+
+    assert created_leaves == [1]
+
+
+def test_bind_sequence_nested_element_exception() -> None:
+    """Exceptions raised while binding an element that don't have a message string are propagated unchanged."""
+
+    @dataclass(frozen=True)
+    class TreeConfig:
+        leaves: dict[str, tuple[list[Leaf], int]]
+
+    with (
+        stream_text(
+            """
+            leaves = {branch = [[{value = -1}], 0]}
+            """
+        ) as stream,
+        pytest.raises(ValueError, match=r"^\('Leaf value must not be negative', -1\)$") as exc_info,
+    ):
+        Binder(TreeConfig).parse_toml(stream)
+
+    assert exc_info.value.args == ("Leaf value must not be negative", -1)
+
+
+def test_bind_sequence_nested_mixed_badelement() -> None:
+    """The context of an element is reported through tables, tuples and arrays."""
+
+    @dataclass(frozen=True)
+    class TreeConfig:
+        leaves: dict[str, tuple[list[Leaf], int]]
+
+    with (
+        stream_text(
+            """
+            leaves = {branch = [[{value = 1}, {value = "two"}], 0]}
+            """
+        ) as stream,
+        pytest.raises(
+            TypeError,
+            match=r"^Value for 'TreeConfig.leaves\[\"branch\"\]\[0\]\[1\].value' has type 'str', expected 'int'$",
+        ),
+    ):
+        Binder(TreeConfig).parse_toml(stream)
+
+
 def test_bind_sequence_heterogenous_badsize() -> None:
     """
     TypeError is raised when the TOML array matching a heterogenous sequence type annotation in the dataclass
@@ -510,6 +718,26 @@ def test_bind_sequence_heterogenous_badsize() -> None:
         Binder(MiniConfig).parse_toml(stream)
 
 
+def test_bind_sequence_heterogenous_badtype() -> None:
+    """
+    TypeError is raised when the TOML value matching a heterogenous sequence type annotation is not an array.
+    """
+
+    @dataclass(frozen=True)
+    class MiniConfig:
+        params: tuple[str, int]
+
+    with (
+        stream_text(
+            """
+            params = "abc"
+            """
+        ) as stream,
+        pytest.raises(TypeError, match=r"^Value for 'MiniConfig.params' has type 'str', expected array$"),
+    ):
+        Binder(MiniConfig).parse_toml(stream)
+
+
 def test_bind_nested_tuple() -> None:
     """Tuples can be nested within other tuples."""
 
@@ -664,6 +892,14 @@ def test_bind_timedelta_direct() -> None:
         Binder(TimeDeltaConfig).parse_toml(stream)
 
 
+def test_bind_timedelta_object() -> None:
+    """A `datetime.timedelta` in data that didn't come from TOML is accepted as-is."""
+
+    duration = timedelta(days=1, minutes=2)
+    config = Binder(TimeDeltaConfig).bind({"duration": duration})
+    assert config.duration is duration
+
+
 def test_bind_timedelta_suffix() -> None:
     """The key suffix indicates the unit for the duration."""
 
@@ -699,6 +935,26 @@ def test_bind_timedelta_suffix() -> None:
         Binder(TimeDeltaConfig).parse_toml(stream)
 
 
+def test_bind_suffix_field_name_clash() -> None:
+    """A field name takes precedence over a suffixed key for another field that reads the same."""
+
+    @dataclass(frozen=True)
+    class ClashConfig:
+        delay: timedelta = timedelta()
+        delay_hours: int = 0
+
+    with stream_text(
+        """
+        delay-hours = 3
+        delay-minutes = 5
+        """
+    ) as stream:
+        config = Binder(ClashConfig).parse_toml(stream)
+
+    assert config.delay == timedelta(minutes=5)
+    assert config.delay_hours == 3
+
+
 def test_bind_unknown_suffix() -> None:
     """Non-existing suffixes are rejected."""
 